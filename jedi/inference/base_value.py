@@ -435,6 +435,12 @@ class ValueSet:
         return cls._from_frozen_set(frozenset(aggregated))
 
     def __or__(self, other):
+        # Value sets are immutable, so an empty side means that the other one
+        # can be reused instead of building an equal set.
+        if not other._set:
+            return self
+        if not self._set:
+            return other
         return self._from_frozen_set(self._set | other._set)
 
     def __and__(self, other):
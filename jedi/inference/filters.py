@@ -22,6 +22,8 @@ _definition_name_cache = weakref.WeakKeyDictionary()
 
 
 class AbstractFilter:
+    __slots__ = ()
+
     _until_position = None
 
     def _filter(self, names):
@@ -75,6 +77,9 @@ def _get_definition_names(parso_cache_node, used_names, name_key):
 
 
 class _AbstractUsedNamesFilter(AbstractFilter):
+    __slots__ = ('_node_context', '_parser_scope', '_parso_cache_node',
+                 '_used_names', 'parent_context')
+
     name_class = TreeNameDefinition
 
     def __init__(self, parent_context, node_context=None):
@@ -127,6 +132,8 @@ class _AbstractUsedNamesFilter(AbstractFilter):
 
 
 class ParserTreeFilter(_AbstractUsedNamesFilter):
+    __slots__ = ('_origin_scope', '_until_position')
+
     def __init__(self, parent_context, node_context=None, until_position=None,
                  origin_scope=None):
         """
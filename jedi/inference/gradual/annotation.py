@@ -10,7 +10,8 @@ from inspect import Parameter
 
 from parso import ParserSyntaxError, parse
 
-from jedi.inference.cache import inference_state_method_cache
+from jedi.inference.cache import inference_state_method_cache, \
+    inference_state_function_cache
 from jedi.inference.base_value import ValueSet, NO_VALUES
 from jedi.inference.gradual.base import DefineGenericBaseClass, GenericClass
 from jedi.inference.gradual.generics import TupleGenericManager
@@ -62,8 +63,18 @@ def _infer_annotation_string(context, string, index=None):
 
 
 def _get_forward_reference_node(context, string):
+    return _parse_forward_reference(
+        context.inference_state, context.tree_node, string)
+
+
+@inference_state_function_cache()
+def _parse_forward_reference(inference_state, tree_node, string):
+    # The same string annotations are inferred over and over again (e.g. for
+    # every execution of a function). The parsed node only depends on the
+    # scope it is placed in, so it is reused. This also means that the
+    # inference caches for the node are reused.
     try:
-        new_node = context.inference_state.grammar.parse(
+        new_node = inference_state.grammar.parse(
             string,
             start_symbol='eval_input',
             error_recovery=False
@@ -72,9 +83,9 @@ def _get_forward_reference_node(context, string):
         debug.warning('Annotation not parsed: %s' % string)
         return None
     else:
-        module = context.tree_node.get_root_node()
+        module = tree_node.get_root_node()
         parser_utils.move(new_node, module.end_pos[0])
-        new_node.parent = context.tree_node
+        new_node.parent = tree_node
         return new_node
 
 
@@ -100,7 +100,8 @@ class DefineGenericBaseClass(LazyValueWrapper):
                 if isinstance(generic, (DefineGenericBaseClass, TypeVar)):
                     result = generic.define_generics(type_var_dict)
                     values |= result
-                    if result != ValueSet({generic}):
+                    # Cheaper than comparing against a new ``ValueSet``.
+                    if len(result) != 1 or generic not in result:
                         changed = True
                 else:
                     values |= ValueSet([generic])
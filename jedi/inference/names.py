@@ -26,6 +26,8 @@ def _merge_name_docs(names):
 
 
 class AbstractNameDefinition:
+    __slots__ = ()
+
     start_pos: Optional[Tuple[int, int]] = None
     string_name: str
     parent_context = None
@@ -107,6 +109,8 @@ class AbstractArbitraryName(AbstractNameDefinition):
 
 
 class AbstractTreeName(AbstractNameDefinition):
+    __slots__ = ('parent_context', 'tree_name')
+
     def __init__(self, parent_context, tree_name):
         self.parent_context = parent_context
         self.tree_name = tree_name
@@ -267,6 +271,8 @@ class ValueName(ValueNameMixin, AbstractTreeName):
 
 
 class TreeNameDefinition(AbstractTreeName):
+    __slots__ = ()
+
     _API_TYPES = dict(
         import_name='module',
         import_from='module',
@@ -361,6 +367,8 @@ class TreeNameDefinition(AbstractTreeName):
 
 
 class _ParamMixin:
+    __slots__ = ()
+
     def maybe_positional_argument(self, include_star=True):
         options = [Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD]
         if include_star:
@@ -386,6 +394,8 @@ class _ParamMixin:
 
 
 class ParamNameInterface(_ParamMixin):
+    __slots__ = ()
+
     api_type = 'param'
 
     def get_kind(self):
@@ -419,6 +429,8 @@ class ParamNameInterface(_ParamMixin):
 
 
 class BaseTreeParamName(ParamNameInterface, AbstractTreeName):
+    __slots__ = ()
+
     annotation_node = None
     default_node = None
 
@@ -6,6 +6,8 @@ from jedi import parser_utils
 
 
 class _SignatureMixin:
+    __slots__ = ()
+
     def to_string(self):
         def param_strings():
             is_positional = False
@@ -36,6 +38,8 @@ class _SignatureMixin:
 
 
 class AbstractSignature(_SignatureMixin):
+    __slots__ = ('value', 'is_bound')
+
     def __init__(self, value, is_bound=False):
         self.value = value
         self.is_bound = is_bound
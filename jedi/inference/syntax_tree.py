@@ -457,6 +457,10 @@ def _infer_expr_stmt(context, stmt, seek_name=None):
 
 
 def infer_or_test(context, or_test):
+    if or_test.type == 'expr':
+        # Only contains ``|`` operators.
+        return _infer_bitwise_or(context, or_test)
+
     iterator = iter(or_test.children)
     types = context.infer_node(next(iterator))
     for operator in iterator:
@@ -481,6 +485,24 @@ def infer_or_test(context, or_test):
     return types
 
 
+def _infer_bitwise_or(context, expr):
+    operand_sets = [context.infer_node(c) for c in expr.children[::2]]
+    if all(operand_sets) and all(value.is_class() or value.is_compiled()
+                                 for value_set in operand_sets
+                                 for value in value_set):
+        # PEP 604 unions like ``int | str | None``. Merging the operands
+        # pairwise would recreate (and rehash) the union for every ``|``,
+        # so the union is built only once.
+        types = ValueSet.from_sets(operand_sets)
+    else:
+        iterator = iter(operand_sets)
+        types = next(iterator)
+        for operator, right_values in zip(expr.children[1::2], iterator):
+            types = _infer_comparison(context, types, operator, right_values)
+    debug.dbg('infer_or_test types %s', types)
+    return types
+
+
 @iterator_to_value_set
 def infer_factor(value_set, operator):
     """
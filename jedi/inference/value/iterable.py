@@ -164,7 +164,7 @@ class ComprehensionMixin:
     @inference_state_method_cache(default=[])
     @to_list
     def _iterate(self):
-        comp_fors = tuple(get_sync_comp_fors(self._sync_comp_for_node))
+        comp_fors = get_sync_comp_fors(self._sync_comp_for_node)
         yield from self._nested(comp_fors)
 
     def py__iter__(self, contextualized_node=None):
@@ -40,7 +40,7 @@ from jedi import debug
 from jedi.parser_utils import get_cached_parent_scope, expr_is_dotted, \
     function_is_property
 from jedi.inference.cache import inference_state_method_cache, CachedMetaClass, \
-    inference_state_method_generator_cache
+    inference_state_method_generator_cache, inference_state_function_cache
 from jedi.inference import compiled
 from jedi.inference.lazy_value import LazyKnownValues, LazyTreeValue
 from jedi.inference.filters import ParserTreeFilter
@@ -55,6 +55,10 @@ from jedi.plugins import plugin_manager
 
 
 class ClassName(TreeNameDefinition):
+    # Class names are created for every name of every class in the mro, so
+    # avoid a __dict__ per instance.
+    __slots__ = ('_apply_decorators', '_class_value')
+
     def __init__(self, class_value, tree_name, name_context, apply_decorators):
         super().__init__(name_context, tree_name)
         self._apply_decorators = apply_decorators
@@ -91,6 +95,10 @@ class ClassName(TreeNameDefinition):
 
 
 class ClassFilter(ParserTreeFilter):
+    # A few of these filters are created for every class that is looked at,
+    # so avoid a __dict__ per instance.
+    __slots__ = ('_class_value', '_is_instance', '_equals_origin_scope_result')
+
     def __init__(self, class_value, node_context=None, until_position=None,
                  origin_scope=None, is_instance=False):
         super().__init__(
@@ -100,6 +108,7 @@ class ClassFilter(ParserTreeFilter):
         )
         self._class_value = class_value
         self._is_instance = is_instance
+        self._equals_origin_scope_result = None
 
     def _convert_names(self, names):
         return [
@@ -112,14 +121,31 @@ class ClassFilter(ParserTreeFilter):
         ]
 
     def _equals_origin_scope(self):
+        # Neither the origin scope nor the parser scope change for a filter,
+        # so the parent walk only needs to happen once per filter, not once
+        # per private name.
+        if self._equals_origin_scope_result is None:
+            self._equals_origin_scope_result = self._search_origin_scope()
+        return self._equals_origin_scope_result
+
+    def _search_origin_scope(self):
+        parser_scope = self._parser_scope
+        parent_context = self.parent_context
+        parso_cache_node = self._parso_cache_node
         node = self._origin_scope
         while node is not None:
-            if node == self._parser_scope or node == self.parent_context:
+            if node == parser_scope or node == parent_context:
                 return True
-            node = get_cached_parent_scope(self._parso_cache_node, node)
+            node = get_cached_parent_scope(parso_cache_node, node)
         return False
 
     def _access_possible(self, name):
+        # Filter for name mangling of private variables like __foo
+        value = name.value
+        if value.startswith('__') and not value.endswith('__') \
+                and not self._equals_origin_scope():
+            return False
+
         # Filter for ClassVar variables
         # TODO this is not properly done, yet. It just checks for the string
         # ClassVar in the annotation, which can be quite imprecise. If we
@@ -131,19 +157,37 @@ class ClassFilter(ParserTreeFilter):
                 if annassign.type == 'annassign':
                     # If there is an =, the variable is obviously also
                     # defined on the class.
-                    if 'ClassVar' not in annassign.children[1].get_code() \
-                            and '=' not in annassign.children:
+                    if '=' not in annassign.children \
+                            and 'ClassVar' not in annassign.children[1].get_code():
                         return False
-
-        # Filter for name mangling of private variables like __foo
-        return not name.value.startswith('__') or name.value.endswith('__') \
-            or self._equals_origin_scope()
+        return True
 
     def _filter(self, names):
         names = super()._filter(names)
         return [name for name in names if self._access_possible(name)]
 
 
+@inference_state_function_cache()
+def _get_type_instance_filters(inference_state, type_):
+    """
+    The filters of ``type`` instances are the same for every class, so they
+    are only created once.
+    """
+    filters = []
+    # We are not using execute_with_values here, because the plugin function
+    # for type would get executed instead of an instance creation.
+    args = ValuesArguments([])
+    for instance in type_.py__call__(args):
+        instance_filters = instance.get_filters()
+        # Filter out self filters
+        next(instance_filters, None)
+        next(instance_filters, None)
+        x = next(instance_filters, None)
+        assert x is not None
+        filters.append(x)
+    return filters
+
+
 class ClassMixin:
     def is_class(self):
         return True
@@ -152,11 +196,11 @@ class ClassMixin:
         return True
 
     def py__call__(self, arguments):
-        from jedi.inference.value import TreeInstance
-
-        from jedi.inference.gradual.typing import TypedDict
         if self.is_typeddict():
+            from jedi.inference.gradual.typing import TypedDict
             return ValueSet([TypedDict(self)])
+
+        from jedi.inference.value import TreeInstance
         return ValueSet([TreeInstance(self.inference_state, self.parent_context, self, arguments)])
 
     def py__class__(self):
@@ -171,11 +215,24 @@ class ClassMixin:
 
     @inference_state_method_generator_cache()
     def py__mro__(self):
-        mro = [self]
+        # Values compare by identity, so an id based set is enough to avoid
+        # duplicates and much cheaper than scanning a list.
+        seen = {id(self)}
         yield self
         # TODO Do a proper mro resolution. Currently we are just listing
         # classes. However, it's a complicated algorithm.
-        for lazy_cls in self.py__bases__():
+        bases = list(self.py__bases__())
+        if len(bases) == 1:
+            # Most classes have exactly one base class, in that case the mro
+            # is simply the mro of that base class.
+            classes = list(bases[0].infer())
+            if len(classes) == 1 and hasattr(classes[0], 'py__mro__'):
+                for cls_new in classes[0].py__mro__():
+                    if cls_new is not self:
+                        yield cls_new
+                return
+
+        for lazy_cls in bases:
             # TODO there's multiple different mro paths possible if this yields
             # multiple possibilities. Could be changed to be more correct.
             for cls in lazy_cls.infer():
@@ -198,8 +255,9 @@ class ClassMixin:
                     debug.warning('Super class of %s is not a class: %s', self, cls)
                 else:
                     for cls_new in mro_method():
-                        if cls_new not in mro:
-                            mro.append(cls_new)
+                        key = id(cls_new)
+                        if key not in seen:
+                            seen.add(key)
                             yield cls_new
 
     def get_filters(self, origin_scope=None, is_instance=False,
@@ -223,19 +281,9 @@ class ClassMixin:
             type_ = builtin_from_name(self.inference_state, 'type')
             assert isinstance(type_, ClassValue)
             if type_ != self:
-                # We are not using execute_with_values here, because the
-                # plugin function for type would get executed instead of an
-                # instance creation.
-                args = ValuesArguments([])
-                for instance in type_.py__call__(args):
-                    instance_filters = instance.get_filters()
-                    # Filter out self filters
-                    next(instance_filters, None)
-                    next(instance_filters, None)
-                    x = next(instance_filters, None)
-                    assert x is not None
-                    yield x
+                yield from _get_type_instance_filters(self.inference_state, type_)
 
+    @inference_state_method_cache(default=[])
     def get_signatures(self):
         # Since calling staticmethod without a function is illegal, the Jedi
         # plugin doesn't return anything. Therefore call directly and get what
@@ -340,9 +388,10 @@ class ClassValue(ClassMixin, FunctionAndClassBase, metaclass=CachedMetaClass):
     @inference_state_method_cache()
     def list_type_vars(self):
         found = []
+        seen = set()
         arglist = self.tree_node.get_super_arglist()
         if arglist is None:
-            return []
+            return ()
 
         for stars, node in unpack_arglist(arglist):
             if stars:
@@ -350,10 +399,11 @@ class ClassValue(ClassMixin, FunctionAndClassBase, metaclass=CachedMetaClass):
 
             from jedi.inference.gradual.annotation import find_unknown_type_vars
             for type_var in find_unknown_type_vars(self.parent_context, node):
-                if type_var not in found:
+                if id(type_var) not in seen:
                     # The order matters and it's therefore a list.
+                    seen.add(id(type_var))
                     found.append(type_var)
-        return found
+        return tuple(found)
 
     def _get_bases_arguments(self):
         arglist = self.tree_node.get_super_arglist()
@@ -362,8 +412,18 @@ class ClassValue(ClassMixin, FunctionAndClassBase, metaclass=CachedMetaClass):
             return arguments.TreeArguments(self.inference_state, self.parent_context, arglist)
         return None
 
-    @inference_state_method_cache(default=())
     def py__bases__(self):
+        # This is called for pretty much every mro lookup, so avoid going
+        # through the cache decorator once the bases are known.
+        try:
+            return self._bases
+        except AttributeError:
+            pass
+        bases = self._bases = self._infer_bases()
+        return bases
+
+    @inference_state_method_cache(default=())
+    def _infer_bases(self):
         args = self._get_bases_arguments()
         if args is not None:
             lst = [value for key, value in args.unpack() if key is None]
@@ -386,11 +446,13 @@ class ClassValue(ClassMixin, FunctionAndClassBase, metaclass=CachedMetaClass):
     def get_metaclasses(self):
         args = self._get_bases_arguments()
         if args is not None:
-            m = [value for key, value in args.unpack() if key == 'metaclass']
-            metaclasses = ValueSet.from_sets(lazy_value.infer() for lazy_value in m)
-            metaclasses = ValueSet(m for m in metaclasses if m.is_class())
+            metaclasses = [
+                value
+                for key, lazy_value in args.unpack() if key == 'metaclass'
+                for value in lazy_value.infer() if value.is_class()
+            ]
             if metaclasses:
-                return metaclasses
+                return ValueSet(metaclasses)
 
         for lazy_base in self.py__bases__():
             for value in lazy_base.infer():
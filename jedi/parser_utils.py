@@ -1,6 +1,7 @@
 import re
 import textwrap
 from ast import literal_eval
+from functools import lru_cache
 from inspect import cleandoc
 from weakref import WeakKeyDictionary
 
@@ -8,14 +9,15 @@ from parso.python import tree
 from parso.cache import parser_cache
 from parso import split_lines
 
-_EXECUTE_NODES = {'funcdef', 'classdef', 'import_from', 'import_name', 'test',
-                  'or_test', 'and_test', 'not_test', 'comparison', 'expr',
-                  'xor_expr', 'and_expr', 'shift_expr', 'arith_expr',
-                  'atom_expr', 'term', 'factor', 'power', 'atom'}
+_EXECUTE_NODES = frozenset({
+    'funcdef', 'classdef', 'import_from', 'import_name', 'test', 'or_test',
+    'and_test', 'not_test', 'comparison', 'expr', 'xor_expr', 'and_expr',
+    'shift_expr', 'arith_expr', 'atom_expr', 'term', 'factor', 'power', 'atom'
+})
 
-_FLOW_KEYWORDS = (
+_FLOW_KEYWORDS = frozenset({
     'try', 'except', 'finally', 'else', 'if', 'elif', 'with', 'for', 'while'
-)
+})
 
 
 def get_executable_nodes(node, last_added=False):
@@ -23,49 +25,52 @@ def get_executable_nodes(node, last_added=False):
     For static analysis.
     """
     result = []
-    typ = node.type
-    if typ == 'name':
-        next_leaf = node.get_next_leaf()
-        if last_added is False and node.parent.type != 'param' and next_leaf != '=':
+    execute_nodes = _EXECUTE_NODES
+    # The tree is walked iteratively (depth first, in order), deeply nested
+    # trees would otherwise lead to a lot of recursion and list copies.
+    stack = [(node, last_added)]
+    while stack:
+        node, last_added = stack.pop()
+        typ = node.type
+        if typ == 'name':
+            next_leaf = node.get_next_leaf()
+            if last_added is False and node.parent.type != 'param' and next_leaf != '=':
+                result.append(node)
+        elif typ == 'expr_stmt':
+            # I think inferring the statement (and possibly returned arrays),
+            # should be enough for static analysis.
             result.append(node)
-    elif typ == 'expr_stmt':
-        # I think inferring the statement (and possibly returned arrays),
-        # should be enough for static analysis.
-        result.append(node)
-        for child in node.children:
-            result += get_executable_nodes(child, last_added=True)
-    elif typ == 'decorator':
-        # decorator
-        if node.children[-2] == ')':
-            node = node.children[-3]
-            if node != '(':
-                result += get_executable_nodes(node)
-    else:
-        try:
-            children = node.children
-        except AttributeError:
-            pass
-        else:
-            if node.type in _EXECUTE_NODES and not last_added:
+            stack.extend((child, True) for child in reversed(node.children))
+        elif typ == 'decorator':
+            # decorator
+            if node.children[-2] == ')':
+                node = node.children[-3]
+                if node != '(':
+                    stack.append((node, False))
+        elif isinstance(node, tree.BaseNode):
+            # Checking the class is much cheaper than raising an
+            # AttributeError for every operator and keyword leaf.
+            if typ in execute_nodes and not last_added:
                 result.append(node)
 
-            for child in children:
-                result += get_executable_nodes(child, last_added)
+            stack.extend((child, last_added) for child in reversed(node.children))
 
     return result
 
 
 def get_sync_comp_fors(comp_for):
-    yield comp_for
+    result = [comp_for]
     last = comp_for.children[-1]
     while True:
-        if last.type == 'comp_for':
-            yield last.children[1]  # Ignore the async.
-        elif last.type == 'sync_comp_for':
-            yield last
-        elif not last.type == 'comp_if':
+        typ = last.type
+        if typ == 'comp_for':
+            result.append(last.children[1])  # Ignore the async.
+        elif typ == 'sync_comp_for':
+            result.append(last)
+        elif not typ == 'comp_if':
             break
         last = last.children[-1]
+    return result
 
 
 def for_stmt_defines_one_name(for_stmt):
@@ -84,12 +89,16 @@ def get_flow_branch_keyword(flow_node, node):
         raise ValueError('The node is not part of the flow.')
 
     keyword = None
-    for i, child in enumerate(flow_node.children):
+    for child in flow_node.children:
         if start_pos < child.start_pos:
             return keyword
-        first_leaf = child.get_first_leaf()
-        if first_leaf in _FLOW_KEYWORDS:
-            keyword = first_leaf
+        # Flow keywords are direct children, except for ``except``, which is
+        # part of an except_clause. Other nodes (e.g. suites) don't need to
+        # be searched for their first leaf.
+        if child.type == 'except_clause':
+            child = child.children[0]
+        if child.type == 'keyword' and child.value in _FLOW_KEYWORDS:
+            keyword = child
     return None
 
 
@@ -101,7 +110,7 @@ def clean_scope_docstring(scope_node):
         # leaves anymore that might be part of the docstring. A
         # docstring can also look like this: ``'foo' 'bar'
         # Returns a literal cleaned version of the ``Token``.
-        return cleandoc(safe_literal_eval(node.value))
+        return _clean_docstring(node.value)
     return ''
 
 
@@ -113,10 +122,17 @@ def find_statement_documentation(tree_node):
             if maybe_string.type == 'simple_stmt':
                 maybe_string = maybe_string.children[0]
                 if maybe_string.type == 'string':
-                    return cleandoc(safe_literal_eval(maybe_string.value))
+                    return _clean_docstring(maybe_string.value)
     return ''
 
 
+@lru_cache(maxsize=4096)
+def _clean_docstring(value):
+    # Parso nodes cannot be weakly referenced, but the result only depends on
+    # the string token, so that is used as the cache key.
+    return cleandoc(safe_literal_eval(value))
+
+
 def safe_literal_eval(value):
     first_two = value[:2].lower()
     if first_two[0] == 'f' or first_two in ('fr', 'rf'):
@@ -157,6 +173,10 @@ def get_signature(funcdef, width=72, call_string=None,
         rtype = ""
     code = call_string + p + rtype
 
+    if len(code) <= width and code.isprintable() and not code.endswith(' '):
+        # Most signatures are short. In that case wrapping would not change
+        # anything as long as there is no special whitespace.
+        return code
     return '\n'.join(textwrap.wrap(code, width))
 
 
@@ -12,8 +12,12 @@ compiled module that returns the types for C-builtins.
 import parso
 import os
 from inspect import Parameter
+from itertools import chain, islice
+from functools import lru_cache
 
 from jedi import debug
+from jedi.cache import memoize_method
+from jedi.inference.cache import inference_state_function_cache
 from jedi.inference.utils import safe_property
 from jedi.inference.helpers import get_str_or_none
 from jedi.inference.arguments import iterate_argument_clinic, ParamIssue, \
@@ -111,6 +115,11 @@ def execute(callback):
         except AttributeError:
             pass
         else:
+            if obj_name not in _implemented_names:
+                # This is by far the most common case and checking the name is
+                # much cheaper than checking the parent context.
+                return call()
+
             p = value.parent_context
             if p is not None and p.is_builtins_module():
                 module_name = 'builtins'
@@ -125,11 +134,8 @@ def execute(callback):
                 return call()
 
             # for now we just support builtin functions.
-            try:
-                func = _implemented[module_name][obj_name]
-            except KeyError:
-                pass
-            else:
+            func = _implemented_functions.get((module_name, obj_name))
+            if func is not None:
                 return func(value, arguments=arguments, callback=call)
         return call()
 
@@ -137,12 +143,11 @@ def execute(callback):
 
 
 def _follow_param(inference_state, arguments, index):
-    try:
-        key, lazy_value = list(arguments.unpack())[index]
-    except IndexError:
+    key_lazy_value = next(islice(arguments.unpack(), index, None), None)
+    if key_lazy_value is None:
         return NO_VALUES
-    else:
-        return lazy_value.infer()
+    key, lazy_value = key_lazy_value
+    return lazy_value.infer()
 
 
 def argument_clinic(clinic_string, want_value=False, want_context=False,
@@ -152,6 +157,9 @@ def argument_clinic(clinic_string, want_value=False, want_context=False,
     Works like Argument Clinic (PEP 436), to validate function params.
     """
 
+    want_kwargs = want_value or want_context or want_arguments \
+        or want_inference_state or want_callback
+
     def f(func):
         def wrapper(value, arguments, callback):
             try:
@@ -161,18 +169,21 @@ def argument_clinic(clinic_string, want_value=False, want_context=False,
                 return NO_VALUES
 
             debug.dbg('builtin start %s' % value, color='MAGENTA')
-            kwargs = {}
-            if want_context:
-                kwargs['context'] = arguments.context
-            if want_value:
-                kwargs['value'] = value
-            if want_inference_state:
-                kwargs['inference_state'] = value.inference_state
-            if want_arguments:
-                kwargs['arguments'] = arguments
-            if want_callback:
-                kwargs['callback'] = callback
-            result = func(*args, **kwargs)
+            if want_kwargs:
+                kwargs = {}
+                if want_context:
+                    kwargs['context'] = arguments.context
+                if want_value:
+                    kwargs['value'] = value
+                if want_inference_state:
+                    kwargs['inference_state'] = value.inference_state
+                if want_arguments:
+                    kwargs['arguments'] = arguments
+                if want_callback:
+                    kwargs['callback'] = callback
+                result = func(*args, **kwargs)
+            else:
+                result = func(*args)
             debug.dbg('builtin end: %s', result, color='MAGENTA')
             return result
 
@@ -212,8 +223,11 @@ def builtins_type(objects, bases, dicts):
     if bases or dicts:
         # It's a type creation... maybe someday...
         return NO_VALUES
-    else:
-        return objects.py__class__()
+    if len(objects) == 1:
+        # The common case of ``type(x)`` with a single inferred value.
+        obj, = objects
+        return ValueSet([obj.py__class__()])
+    return objects.py__class__()
 
 
 class SuperInstance(LazyValueWrapper):
@@ -222,6 +236,7 @@ class SuperInstance(LazyValueWrapper):
         self.inference_state = inference_state
         self._instance = instance  # Corresponds to super().__self__
 
+    @memoize_method
     def _get_bases(self):
         return self._instance.py__class__().py__bases__()
 
@@ -256,15 +271,20 @@ class ReversedObject(AttributeOverwrite):
     def __init__(self, reversed_obj, iter_list):
         super().__init__(reversed_obj)
         self._iter_list = iter_list
+        self._next_values = None
 
     def py__iter__(self, contextualized_node=None):
         return self._iter_list
 
     @publish_method('__next__')
     def _next(self, arguments):
-        return ValueSet.from_sets(
-            lazy_value.infer() for lazy_value in self._iter_list
-        )
+        # The result doesn't depend on the arguments, so only infer the
+        # values once.
+        if self._next_values is None:
+            self._next_values = ValueSet.from_sets(
+                lazy_value.infer() for lazy_value in self._iter_list
+            )
+        return self._next_values
 
 
 @argument_clinic('sequence, /', want_value=True, want_arguments=True)
@@ -277,18 +297,19 @@ def builtins_reversed(sequences, value, arguments):
     if isinstance(lazy_value, LazyTreeValue):
         cn = ContextualizedNode(lazy_value.context, lazy_value.data)
     ordered = list(sequences.iterate(cn))
+    ordered.reverse()
 
     # Repack iterator values and then run it the normal way. This is
     # necessary, because `reversed` is a function and autocompletion
     # would fail in certain cases like `reversed(x).__iter__` if we
     # just returned the result directly.
     seq, = value.inference_state.typing_module.py__getattribute__('Iterator').execute_with_values()
-    return ValueSet([ReversedObject(seq, list(reversed(ordered)))])
+    return ValueSet([ReversedObject(seq, ordered)])
 
 
 @argument_clinic('value, type, /', want_arguments=True, want_inference_state=True)
 def builtins_isinstance(objects, types, arguments, inference_state):
-    bool_results = set()
+    maybe_true = maybe_false = False
     for o in objects:
         cls = o.py__class__()
         try:
@@ -297,14 +318,15 @@ def builtins_isinstance(objects, types, arguments, inference_state):
             # This is temporary. Everything should have a class attribute in
             # Python?! Maybe we'll leave it here, because some numpy objects or
             # whatever might not.
-            bool_results = set([True, False])
+            maybe_true = maybe_false = True
             break
 
-        mro = list(cls.py__mro__())
+        # Values are compared by identity, so a set works for the lookups.
+        mro = set(cls.py__mro__())
 
         for cls_or_tup in types:
             if cls_or_tup.is_class():
-                bool_results.add(cls_or_tup in mro)
+                result = cls_or_tup in mro
             elif cls_or_tup.name.string_name == 'tuple' \
                     and cls_or_tup.get_root_context().is_builtins_module():
                 # Check for tuples.
@@ -312,19 +334,40 @@ def builtins_isinstance(objects, types, arguments, inference_state):
                     lazy_value.infer()
                     for lazy_value in cls_or_tup.iterate()
                 )
-                bool_results.add(any(cls in mro for cls in classes))
+                result = any(cls in mro for cls in classes)
             else:
-                _, lazy_value = list(arguments.unpack())[1]
+                _, lazy_value = next(islice(arguments.unpack(), 1, None))
                 if isinstance(lazy_value, LazyTreeValue):
                     node = lazy_value.data
                     message = 'TypeError: isinstance() arg 2 must be a ' \
                               'class, type, or tuple of classes and types, ' \
                               'not %s.' % cls_or_tup
                     analysis.add(lazy_value.context, 'type-error-isinstance', node, message)
+                continue
+            if result:
+                maybe_true = True
+            else:
+                maybe_false = True
 
-    return ValueSet(
-        compiled.builtin_from_name(inference_state, str(b))
-        for b in bool_results
+        if maybe_true and maybe_false:
+            # Both True and False are possible, other objects cannot change
+            # the result anymore.
+            break
+
+    true_value, false_value = _get_bool_values(inference_state)
+    bool_results = []
+    if maybe_true:
+        bool_results.append(true_value)
+    if maybe_false:
+        bool_results.append(false_value)
+    return ValueSet(bool_results)
+
+
+@inference_state_function_cache()
+def _get_bool_values(inference_state):
+    return (
+        compiled.builtin_from_name(inference_state, 'True'),
+        compiled.builtin_from_name(inference_state, 'False'),
     )
 
 
@@ -369,9 +412,10 @@ class ClassMethodArguments(TreeArgumentsWrapper):
         self._class = klass
 
     def unpack(self, func=None):
-        yield None, LazyKnownValue(self._class)
-        for values in self._wrapped_arguments.unpack(func):
-            yield values
+        return chain(
+            [(None, LazyKnownValue(self._class))],
+            self._wrapped_arguments.unpack(func),
+        )
 
 
 @argument_clinic('sequence, /', want_value=True, want_arguments=True)
@@ -439,39 +483,53 @@ def collections_namedtuple(value, arguments, callback):
         fields = string.replace(',', ' ').split()
     elif isinstance(_fields, iterable.Sequence):
         fields = [
-            get_str_or_none(v)
+            f
             for lazy_value in _fields.py__iter__()
             for v in lazy_value.infer()
+            for f in [get_str_or_none(v)]
+            if f is not None
         ]
-        fields = [f for f in fields if f is not None]
     else:
         return NO_VALUES
 
+    module, code_lines = _parse_namedtuple(inference_state.grammar, name, tuple(fields))
+    generated_class = next(module.iter_classdefs())
+    parent_context = ModuleValue(
+        inference_state, module,
+        code_lines=code_lines,
+    ).as_context()
+
+    return ValueSet([ClassValue(inference_state, parent_context, generated_class)])
+
+
+@lru_cache(maxsize=256)
+def _parse_namedtuple(grammar, name, fields):
+    """
+    Parsing is by far the most expensive part of inferring a namedtuple and
+    the generated code only depends on the name and the fields.
+    """
     # Build source code
     code = _NAMEDTUPLE_CLASS_TEMPLATE.format(
         typename=name,
-        field_names=tuple(fields),
+        field_names=fields,
         num_fields=len(fields),
-        arg_list=repr(tuple(fields)).replace("'", "")[1:-1],
+        arg_list=repr(fields).replace("'", "")[1:-1],
         repr_fmt='',
         field_defs='\n'.join(_NAMEDTUPLE_FIELD_TEMPLATE.format(index=index, name=name)
                              for index, name in enumerate(fields))
     )
 
     # Parse source code
-    module = inference_state.grammar.parse(code)
-    generated_class = next(module.iter_classdefs())
-    parent_context = ModuleValue(
-        inference_state, module,
-        code_lines=parso.split_lines(code, keepends=True),
-    ).as_context()
-
-    return ValueSet([ClassValue(inference_state, parent_context, generated_class)])
+    module = grammar.parse(code)
+    return module, parso.split_lines(code, keepends=True)
 
 
 class PartialObject(ValueWrapper):
     def __init__(self, actual_value, arguments, instance=None):
         super().__init__(actual_value)
+        # This is accessed by all the caches, avoid going through __getattr__
+        # every time.
+        self.inference_state = actual_value.inference_state
         self._arguments = arguments
         self._instance = instance
 
@@ -554,12 +612,10 @@ class MergedPartialArguments(AbstractArguments):
         # Ignore this one, it's the function. It was checked before that it's
         # there.
         next(unpacked, None)
+        call_unpacked = self._call_arguments.unpack(funcdef)
         if self._instance is not None:
-            yield None, LazyKnownValue(self._instance)
-        for key_lazy_value in unpacked:
-            yield key_lazy_value
-        for key_lazy_value in self._call_arguments.unpack(funcdef):
-            yield key_lazy_value
+            return chain([(None, LazyKnownValue(self._instance))], unpacked, call_unpacked)
+        return chain(unpacked, call_unpacked)
 
 
 def functools_partial(value, arguments, callback):
@@ -610,22 +666,27 @@ class DataclassWrapper(ValueWrapper, ClassMixin):
                 # implementation detail anyway.
                 for name in sorted(filter_.values(), key=lambda name: name.start_pos):
                     d = name.tree_name.get_definition()
+                    if d.type != 'expr_stmt':
+                        continue
                     annassign = d.children[1]
-                    if d.type == 'expr_stmt' and annassign.type == 'annassign':
-                        if len(annassign.children) < 4:
+                    if annassign.type == 'annassign':
+                        children = annassign.children
+                        if len(children) < 4:
                             default = None
                         else:
-                            default = annassign.children[3]
+                            default = children[3]
                         param_names.append(DataclassParamName(
                             parent_context=cls.parent_context,
                             tree_name=name.tree_name,
-                            annotation_node=annassign.children[1],
+                            annotation_node=children[1],
                             default_node=default,
                         ))
         return [DataclassSignature(cls, param_names)]
 
 
 class DataclassSignature(AbstractSignature):
+    __slots__ = ('_param_names',)
+
     def __init__(self, value, param_names):
         super().__init__(value)
         self._param_names = param_names
@@ -635,6 +696,8 @@ class DataclassSignature(AbstractSignature):
 
 
 class DataclassParamName(BaseTreeParamName):
+    __slots__ = ('annotation_node', 'default_node')
+
     def __init__(self, parent_context, tree_name, annotation_node, default_node):
         super().__init__(parent_context, tree_name)
         self.annotation_node = annotation_node
@@ -657,18 +720,23 @@ class ItemGetterCallable(ValueWrapper):
 
     @repack_with_argument_clinic('item, /')
     def py__call__(self, item_value_set):
+        get_item = item_value_set.get_item
         value_set = NO_VALUES
         for args_value in self._args_value_set:
-            lazy_values = list(args_value.py__iter__())
-            if len(lazy_values) == 1:
+            lazy_values = iter(args_value.py__iter__())
+            first = next(lazy_values, None)
+            second = next(lazy_values, None)
+            if first is not None and second is None:
+                # The common case of ``itemgetter(0)``.
                 # TODO we need to add the contextualized value.
-                value_set |= item_value_set.get_item(lazy_values[0].infer(), None)
+                value_set |= get_item(first.infer(), None)
             else:
                 value_set |= ValueSet([iterable.FakeList(
                     self._wrapped_value.inference_state,
                     [
-                        LazyKnownValues(item_value_set.get_item(lazy_value.infer(), None))
-                        for lazy_value in lazy_values
+                        LazyKnownValues(get_item(lazy_value.infer(), None))
+                        for lazy_value in chain([first, second], lazy_values)
+                        if lazy_value is not None
                     ],
                 )])
         return value_set
@@ -712,13 +780,13 @@ def _operator_itemgetter(args_value_set, value, arguments):
 def _create_string_input_function(func):
     @argument_clinic('string, /', want_value=True, want_arguments=True)
     def wrapper(strings, value, arguments):
-        def iterate():
-            for value in strings:
-                s = get_str_or_none(value)
-                if s is not None:
-                    s = func(s)
-                    yield compiled.create_simple_object(value.inference_state, s)
-        values = ValueSet(iterate())
+        create_simple_object = compiled.create_simple_object
+        values = ValueSet([
+            create_simple_object(v.inference_state, func(s))
+            for v in strings
+            for s in [get_str_or_none(v)]
+            if s is not None
+        ])
         if values:
             return values
         return value.py__call__(arguments)
@@ -728,9 +796,8 @@ def _create_string_input_function(func):
 @argument_clinic('*args, /', want_callback=True)
 def _os_path_join(args_set, callback):
     if len(args_set) == 1:
-        string = ''
+        parts = []
         sequence, = args_set
-        is_first = True
         for lazy_value in sequence.py__iter__():
             string_values = lazy_value.infer()
             if len(string_values) != 1:
@@ -738,11 +805,9 @@ def _os_path_join(args_set, callback):
             s = get_str_or_none(next(iter(string_values)))
             if s is None:
                 break
-            if not is_first:
-                string += os.path.sep
-            string += s
-            is_first = False
+            parts.append(s)
         else:
+            string = os.path.sep.join(parts)
             return ValueSet([compiled.create_simple_object(sequence.inference_state, string)])
     return callback()
 
@@ -819,6 +884,12 @@ _implemented = {
         'join': _os_path_join,
     }
 }
+_implemented_functions = {
+    (module_name, obj_name): func
+    for module_name, functions in _implemented.items()
+    for obj_name, func in functions.items()
+}
+_implemented_names = frozenset(obj_name for _, obj_name in _implemented_functions)
 
 
 def get_metaclass_filters(func):